@@ -84,19 +84,72 @@ connections) and uncomment the relevant code section in
 ``load_data_from_database``.
 """
 
+import concurrent.futures as cf
+import hashlib
+import io
 import os
+import threading
+import time
+import types
 from datetime import datetime, timedelta
+from functools import lru_cache
 from math import sqrt
 from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
+from joblib import Parallel, delayed
 from scipy.stats import norm
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+
+from forecast_utils import fit_holt, lttb_indices
 from statsmodels.tsa.holtwinters import ExponentialSmoothing
 from statsmodels.tsa.arima.model import ARIMA
 
+# Optional compiled forecasting backend.  statsforecast implements the
+# exponential smoothing recursion and its likelihood in compiled code,
+# which fits one to two orders of magnitude faster than the pure-Python
+# optimiser loop in statsmodels.  The import is optional so the app
+# still runs from the base requirements.
+try:
+    from statsforecast.models import AutoETS as _AutoETS
+    from statsforecast.models import ARIMA as _CompiledARIMA
+except ImportError:  # pragma: no cover - optional dependency
+    _AutoETS = None
+    _CompiledARIMA = None
+
+# Backend selection for model fitting.  "auto" prefers the compiled
+# statsforecast implementation when it is installed; set the
+# ``DPA_FORECAST_BACKEND`` environment variable to ``statsmodels`` to
+# force the legacy path (useful for edge cases the compiled backend
+# does not cover).
+FORECAST_BACKEND = os.getenv("DPA_FORECAST_BACKEND", "auto").lower()
+
+# Persistent second-level cache for prepared time series.  st.cache_data
+# only lives in process memory, so a Streamlit worker restart forces a
+# full re-parse and re-aggregation; the disk cache survives restarts.
+try:
+    import diskcache
+
+    _DISK_CACHE = diskcache.Cache(os.path.join(os.path.dirname(__file__), ".dpa_cache"))
+except Exception:  # pragma: no cover - optional dependency
+    _DISK_CACHE = None
+
+if _AutoETS is not None and FORECAST_BACKEND != "statsmodels":
+    # Warm the compiled backend once at import so the first user-facing
+    # forecast does not pay any one-off compilation/initialisation cost.
+    try:
+        _AutoETS(season_length=1, model="AAN").forecast(
+            y=np.arange(8, dtype=np.float64), h=1
+        )
+    except Exception:  # pragma: no cover - backend unusable, fall back
+        _AutoETS = None
+
 # -----------------------------------------------------------------------------
 # UI/UX configuration
 #
@@ -107,14 +160,89 @@ from statsmodels.tsa.arima.model import ARIMA
 st.set_page_config(page_title="Demand Planning Application", page_icon="📈", layout="wide")
 
 
+@st.cache_data(
+    show_spinner=False,
+    hash_funcs={UploadedFile: lambda f: f.getvalue()[:1024] + str(f.size).encode()},
+)
+def _read_uploaded_file(uploaded_file: UploadedFile) -> pd.DataFrame:
+    """Parse an uploaded file into a DataFrame based on its extension.
+
+    Parquet files are read directly (columnar, near-zero parse cost) and
+    CSV files use the multithreaded pyarrow parser.  Excel workbooks are
+    parsed once with openpyxl and a Parquet copy is kept in session
+    state keyed by the file hash, so subsequent reruns skip the slow
+    Excel parse entirely.
+    """
+    filename = uploaded_file.name.lower()
+    if filename.endswith(".parquet"):
+        return pd.read_parquet(uploaded_file, engine="pyarrow")
+    if filename.endswith((".csv", ".tsv")):
+        return pd.read_csv(uploaded_file, engine="pyarrow")
+    if filename.endswith((".xlsx", ".xls")):
+        sidecar_key = "_parquet_sidecar_" + hashlib.sha1(uploaded_file.getvalue()).hexdigest()
+        sidecar = st.session_state.get(sidecar_key)
+        if sidecar is not None:
+            return pd.read_parquet(io.BytesIO(sidecar), engine="pyarrow")
+        data = pd.read_excel(uploaded_file)
+        try:
+            buffer = io.BytesIO()
+            data.to_parquet(buffer, engine="pyarrow")
+            st.session_state[sidecar_key] = buffer.getvalue()
+        except Exception:
+            # Columns that Parquet cannot represent are not fatal; the
+            # sidecar is only an optimisation.
+            pass
+        return data
+    raise ValueError("Unsupported file type. Please upload a CSV, Excel or Parquet file.")
+
+
+# Threshold above which CSV uploads are streamed in chunks rather than
+# materialised in one read, and the number of rows per chunk.
+_LARGE_FILE_BYTES = 100 * 1024 * 1024
+_CSV_CHUNK_ROWS = 250_000
+
+
+def peek_columns(uploaded_file: UploadedFile) -> list:
+    """Return the column names of a CSV upload without parsing any rows.
+
+    Reading only the header lets the UI offer column pickers before the
+    full (and potentially expensive) parse happens.
+    """
+    uploaded_file.seek(0)
+    columns = pd.read_csv(uploaded_file, nrows=0).columns.tolist()
+    uploaded_file.seek(0)
+    return columns
+
+
+def load_selected(uploaded_file: UploadedFile, usecols: list) -> pd.DataFrame:
+    """Load only the selected columns of a CSV upload.
+
+    Restricting the parse with ``usecols`` keeps peak memory
+    proportional to the columns actually used rather than the file
+    width.  Files larger than ~100 MB are additionally streamed in
+    250k-row chunks so the whole file never sits in RAM twice.
+    """
+    uploaded_file.seek(0)
+    if uploaded_file.size > _LARGE_FILE_BYTES:
+        chunks = pd.read_csv(
+            uploaded_file, usecols=usecols, chunksize=_CSV_CHUNK_ROWS, engine="c"
+        )
+        data = pd.concat(chunks, ignore_index=True)
+    else:
+        data = pd.read_csv(uploaded_file, usecols=usecols, engine="pyarrow")
+    uploaded_file.seek(0)
+    return data
+
+
 def load_data_from_upload() -> Optional[pd.DataFrame]:
-    """Load a CSV or Excel file uploaded by the user.
+    """Load a CSV, Excel or Parquet file uploaded by the user.
 
-    This helper accepts comma‑separated files (``*.csv``) as well as Excel
-    workbooks (``*.xlsx`` and ``*.xls``).  It attempts to parse the file
-    with ``pandas.read_csv`` first for CSV; otherwise falls back to
-    ``pandas.read_excel``.  Invalid or unsupported files result in an
-    error message and return ``None``.
+    This helper accepts comma‑separated files (``*.csv``), Excel
+    workbooks (``*.xlsx`` and ``*.xls``) and Parquet files
+    (``*.parquet``).  Parsing is delegated to
+    :func:`_read_uploaded_file`, which caches results by file content so
+    Streamlit reruns do not re-parse an unchanged upload.  Invalid or
+    unsupported files result in an error message and return ``None``.
 
     Returns
     -------
@@ -122,8 +250,8 @@ def load_data_from_upload() -> Optional[pd.DataFrame]:
         Parsed tabular data when a file is provided, otherwise ``None``.
     """
     uploaded_file = st.file_uploader(
-        "Upload a CSV or Excel file containing your demand history",
-        type=["csv", "xlsx", "xls"],
+        "Upload a CSV, Excel or Parquet file containing your demand history",
+        type=["csv", "xlsx", "xls", "parquet"],
         help=(
             "The file should contain at least a date column and a demand column. "
             "Additional features such as promotions or holidays may also be included."
@@ -131,17 +259,26 @@ def load_data_from_upload() -> Optional[pd.DataFrame]:
     )
     if uploaded_file is None:
         return None
-    # Use the filename extension to decide how to load the file
-    filename = uploaded_file.name.lower()
+    if uploaded_file.name.lower().endswith((".xlsx", ".xls")):
+        st.warning(
+            "Excel parsing is slow for large workbooks. The parsed table is cached "
+            "for this session, but consider uploading CSV or Parquet instead."
+        )
     try:
-        if filename.endswith(('.csv', '.tsv')):
-            data = pd.read_csv(uploaded_file)
-        elif filename.endswith(('.xlsx', '.xls')):
-            # openpyxl or xlrd engine will be used automatically
-            data = pd.read_excel(uploaded_file)
+        if uploaded_file.name.lower().endswith((".csv", ".tsv")) and st.checkbox(
+            "Load only selected columns",
+            help=(
+                "Reads just the header first so you can pick the relevant columns "
+                "before the full parse. Recommended for wide files."
+            ),
+        ):
+            usecols = st.multiselect("Columns to load", options=peek_columns(uploaded_file))
+            if not usecols:
+                st.info("Select at least one column to load.")
+                return None
+            data = _run_with_status("Parsing file...", load_selected, uploaded_file, usecols)
         else:
-            st.error("Unsupported file type. Please upload a CSV or Excel file.")
-            return None
+            data = _run_with_status("Parsing file...", _read_uploaded_file, uploaded_file)
     except Exception as e:
         st.error(f"Failed to read file: {e}")
         return None
@@ -170,64 +307,331 @@ def load_data_from_database() -> Optional[pd.DataFrame]:
     return None
 
 
-@st.cache_data(show_spinner=False)
+# Aggregations with dedicated Cython groupby kernels.  Calling these as
+# bound methods (groupby(...).sum()) dispatches straight into the fast
+# kernel, whereas .aggregate("sum") routes through the generic aggregate
+# dispatcher first.
+_BUILTIN_AGGS = frozenset({"sum", "mean", "min", "max", "std", "count", "first", "last"})
+
+# Optional numpy-groupies backend for pure-numeric single-column
+# reductions: it aggregates factorized keys in one tight kernel without
+# constructing any SeriesGroupBy machinery.
+try:
+    import numpy_groupies as _npg
+except ImportError:  # pragma: no cover - optional dependency
+    _npg = None
+
+_NPG_AGGS = frozenset({"sum", "mean", "min", "max", "prod", "any", "all"})
+
+
+def _aggregate_by_date(
+    df: pd.DataFrame,
+    date_col: str,
+    demand_col: str,
+    agg_func,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
+    sort: bool = True,
+) -> pd.Series:
+    """Aggregate the demand column by date.
+
+    ``sort=False`` skips groupby's key sort and returns groups in order
+    of first appearance; callers pass it when the input is already
+    sorted by date, where appearance order and sorted order coincide.
+
+    For the common case — naive, midnight-aligned timestamps with a
+    numeric demand column and sum/mean aggregation — the group keys are
+    reduced to int64 day numbers and aggregated with ``np.bincount``,
+    which skips the pandas groupby machinery (and its per-Timestamp
+    hashing) entirely.  Anything else falls back to a regular groupby.
+
+    Callable aggregations are invoked per group in Python unless
+    ``engine`` (e.g. ``"numba"``) is given, in which case pandas
+    compiles the callable into a loop over the group values; pandas
+    caches the compiled kernel per function, so the one-off compile
+    cost is amortized across calls.
+    """
+    day_ns = 86_400_000_000_000
+    if (
+        agg_func in ("sum", "mean")
+        and df[date_col].dtype == "datetime64[ns]"
+        and pd.api.types.is_numeric_dtype(df[demand_col])
+    ):
+        stamps = df[date_col].to_numpy().view("i8")
+        if stamps.size and not (stamps % day_ns).any():
+            unique_days, inverse = np.unique(stamps // day_ns, return_inverse=True)
+            values = df[demand_col].to_numpy(dtype=np.float64)
+            agg = np.bincount(inverse, weights=values)
+            if agg_func == "mean":
+                agg = agg / np.bincount(inverse)
+            index = pd.DatetimeIndex(
+                (unique_days * day_ns).view("datetime64[ns]"), name=date_col
+            )
+            return pd.Series(agg, index=index, name=demand_col)
+    if (
+        _npg is not None
+        and len(df)
+        and not callable(agg_func)
+        and agg_func in _NPG_AGGS
+        and pd.api.types.is_datetime64_any_dtype(df[date_col])
+        and pd.api.types.is_numeric_dtype(df[demand_col])
+    ):
+        # Intraday timestamps land here: factorize the exact keys and
+        # reduce them in a single numpy-groupies kernel.
+        codes, uniques = pd.factorize(df[date_col], sort=sort)
+        out = _npg.aggregate(
+            codes, df[demand_col].to_numpy(dtype=np.float64), func=agg_func
+        )
+        return pd.Series(out, index=pd.DatetimeIndex(uniques, name=date_col), name=demand_col)
+    grouped = df.groupby(date_col, sort=sort)[demand_col]
+    if not callable(agg_func) and agg_func in _BUILTIN_AGGS:
+        return getattr(grouped, agg_func)()
+    if callable(agg_func) and engine is not None:
+        return grouped.agg(agg_func, engine=engine, engine_kwargs=engine_kwargs)
+    # Generic path for user-supplied callables and exotic names.
+    return grouped.aggregate(agg_func)
+
+
+@st.cache_data(
+    show_spinner=False,
+    # Allow callable agg_func arguments: key them by qualified name and
+    # bytecode, which Streamlit's default hasher cannot do on its own.
+    hash_funcs={
+        types.FunctionType: lambda f: f"{f.__module__}.{f.__qualname__}".encode()
+        + f.__code__.co_code
+    },
+)
 def prepare_time_series(
-    data: pd.DataFrame, date_col: str, demand_col: str, agg_func: str = "sum"
+    data: pd.DataFrame,
+    date_col: str,
+    demand_col: str,
+    agg_func: str = "sum",
+    trim_outlier_dates: bool = True,
+    downcast_float32: bool = True,
+    engine: Optional[str] = None,
+    engine_kwargs: Optional[dict] = None,
+    presorted: bool = False,
 ) -> pd.Series:
     """Prepare a pandas Series indexed by datetime for modelling.
 
     The function groups data by the selected date column using the
     aggregation function (sum or mean) and sorts the index.  It
     converts the index to ``datetime`` and fills missing dates by
-    forward filling demand values.  You can clear the cache by
-    reloading the app when your dataset changes.
+    forward filling demand values.  Results are cached in memory for
+    the session and, when diskcache is installed, as Parquet on disk
+    keyed by the data hash and parameters, so identical preparations
+    are near-instant even after a worker restart.  You can clear the
+    in-memory cache by reloading the app when your dataset changes.
 
     Args:
         data: The raw DataFrame.
         date_col: Name of the column containing date information.
         demand_col: Name of the column containing demand values.
         agg_func: Aggregation function to apply when grouping data
-            by date.  Accepts 'sum' or 'mean'.
+            by date.  Accepts a built-in aggregation name such as
+            'sum' or 'mean' (dispatched to the fast groupby kernels)
+            or a callable applied per group.
+        trim_outlier_dates: Drop rows whose dates are separated from
+            the rest of the series by a huge gap (e.g. a stray
+            1970-01-01 sentinel).  Without this, filling missing dates
+            would allocate one row per period across the whole span.
+        downcast_float32: Store the prepared values as float32.  Demand
+            counts never need 15 significant digits, and halving the
+            bytes moved speeds up every downstream pass over the
+            series; disable for high-precision monetary demand.
+        engine: Execution engine forwarded to ``groupby.agg`` for
+            callable aggregations; pass ``"numba"`` to compile the
+            callable instead of invoking it per group in Python.
+        engine_kwargs: Options for the engine, e.g.
+            ``{"nopython": True, "nogil": True}``.
+        presorted: Declare that ``data`` is already sorted by the date
+            column.  Skips both the monotonicity check and the key sort
+            inside the groupby; time-series exports are usually written
+            in date order, so this saves an O(N log N) pass.  When
+            False the function still detects sorted input on its own.
 
     Returns:
         A pandas Series with datetime index and numeric values.
     """
+    cache_key = None
+    if _DISK_CACHE is not None and not callable(agg_func):
+        try:
+            digest = hashlib.sha1(
+                pd.util.hash_pandas_object(data[[date_col, demand_col]], index=False).values.tobytes()
+            ).hexdigest()
+            cache_key = (
+                f"{digest}|{date_col}|{demand_col}|{agg_func}|{trim_outlier_dates}|{downcast_float32}"
+            )
+            hit = _DISK_CACHE.get(cache_key)
+            if hit is not None:
+                payload, freq = hit
+                frame = pd.read_parquet(io.BytesIO(payload), engine="pyarrow")
+                series = frame[frame.columns[0]]
+                if freq:
+                    series.index.freq = freq
+                return series
+        except Exception:
+            cache_key = None
     df = data.copy()
-    # Ensure the date column is parsed to datetime
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    # Ensure the date column is parsed to datetime.  Columns that are
+    # already typed skip the per-value string parse — the dominant cost
+    # of this function on small inputs — and cache=True deduplicates
+    # the parse for repeated date strings.
+    if not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        df[date_col] = pd.to_datetime(df[date_col], errors="coerce", cache=True)
+    elif isinstance(df[date_col].dtype, np.dtype) and df[date_col].dtype != "datetime64[ns]":
+        # Coarser units (e.g. datetime64[D]/[s] from typed numpy input)
+        # would defeat the nanosecond-based fast paths below.
+        df[date_col] = df[date_col].astype("datetime64[ns]")
     # Drop rows with invalid dates or missing demand
     df = df.dropna(subset=[date_col, demand_col])
-    if agg_func == "sum":
-        series = df.groupby(date_col)[demand_col].sum()
-    else:
-        series = df.groupby(date_col)[demand_col].mean()
-    # Sort by date
-    series = series.sort_index()
+    # Already-sorted input (the common case for time-series exports) can
+    # keep appearance order through the groupby and skip the sort below.
+    sorted_input = presorted or df[date_col].is_monotonic_increasing
+    series = _aggregate_by_date(
+        df,
+        date_col,
+        demand_col,
+        agg_func,
+        engine=engine,
+        engine_kwargs=engine_kwargs,
+        sort=not sorted_input,
+    )
+    if not sorted_input:
+        # Sort by date
+        series = series.sort_index()
+    if trim_outlier_dates and len(series) > 2:
+        gaps = np.diff(series.index.asi8)
+        if gaps.max() > 1000 * max(np.median(gaps), 1):
+            # Keep the larger side of the biggest gap; the other side is
+            # almost certainly bad data and would blow up the reindex.
+            split = int(gaps.argmax()) + 1
+            keep_head = split >= len(series) - split
+            dropped = len(series) - split if keep_head else split
+            series = series.iloc[:split] if keep_head else series.iloc[split:]
+            st.warning(
+                f"Dropped {dropped} row(s) with outlier dates far outside the rest of "
+                "the series. Untick 'Trim outlier dates' in the Data Upload section "
+                "to keep them."
+            )
     # Infer frequency; if none, use the most common difference
     if hasattr(series.index, "inferred_freq") and series.index.inferred_freq:
         freq = series.index.inferred_freq
     else:
-        # Try to infer by the mode of the difference in days
-        diffs = series.index.to_series().diff().dropna().dt.days
-        if not diffs.empty:
-            # Most common difference
-            mode = diffs.mode()[0]
-            freq = f"{int(mode)}D"
-        else:
-            freq = "D"
-    series = series.asfreq(freq, method="ffill")
+        # Most common gap in days, computed in a single vectorized pass
+        # over the underlying int64 datetime buffer (no intermediate
+        # Series/Timedelta objects).
+        day_ns = 86_400_000_000_000
+        days = np.diff(series.index.asi8) // day_ns
+        # Sub-daily gaps round down to zero days; fall back to daily
+        # rather than producing an unusable "0D" frequency.
+        freq = f"{max(int(np.bincount(days).argmax()), 1)}D" if days.size else "D"
+    # Skip the asfreq reindex (a full allocation + copy) when the index
+    # is already a complete range at the target frequency — the common
+    # case for clean daily/weekly extracts.
+    try:
+        freq_delta = pd.Timedelta(pd.tseries.frequencies.to_offset(freq))
+    except Exception:
+        # Calendar-based frequencies (e.g. month end) have no fixed
+        # delta; let asfreq handle them.
+        freq_delta = None
+    if (
+        freq_delta is not None
+        and len(series)
+        # Exact spacing, not just a matching point count: mixed gaps can
+        # average out to the right span while still needing a fill.
+        and (np.diff(series.index.asi8) == freq_delta.value).all()
+    ):
+        series.index.freq = freq
+    elif freq_delta is not None and len(series):
+        # Fill gaps without reindex: asfreq builds a hash table over the
+        # new DatetimeIndex to join the old one, but the aggregated
+        # index is already sorted, so a binary search places the
+        # existing values directly into the full range.
+        step = freq_delta.value
+        left = series.index.asi8
+        full = np.arange(left[0], left[-1] + 1, step, dtype=np.int64)
+        # Pad semantics, matching asfreq(..., method="ffill"): each grid
+        # point takes the last observation at or before it, so demand
+        # recorded between grid points is carried forward rather than
+        # dropped.  full[0] == left[0], so pos is never negative.
+        pos = np.searchsorted(left, full, side="right") - 1
+        index = pd.DatetimeIndex(
+            full.view("datetime64[ns]"), freq=freq, name=series.index.name
+        )
+        series = pd.Series(
+            series.to_numpy(dtype=np.float64)[pos], index=index, name=series.name
+        )
+    else:
+        # Pad, not reindex-then-ffill: each grid point must take the last
+        # original observation at or before it, including observations
+        # that sit between grid points.
+        series = series.asfreq(freq, method="ffill")
+    if downcast_float32:
+        # Model fits upcast to float64 internally where accuracy needs
+        # it; float32 is what gets carried through session state,
+        # pandas and Plotly.
+        series = series.astype(np.float32)
+    if cache_key is not None:
+        try:
+            buffer = io.BytesIO()
+            series.to_frame().to_parquet(buffer, engine="pyarrow")
+            _DISK_CACHE[cache_key] = (buffer.getvalue(), series.index.freqstr)
+        except Exception:
+            # The disk cache is only an optimisation; never fail the
+            # preparation because of it.
+            pass
     return series
 
 
-def forecast_exponential_smoothing(
-    series: pd.Series, forecast_horizon: int, seasonal_periods: Optional[int] = None
-) -> Tuple[pd.Series, pd.Series]:
-    """Produce a forecast using Exponential Smoothing.
+def _rebuild_series(values_bytes: bytes, index_bytes: bytes, freq: str) -> pd.Series:
+    """Reconstruct a demand series from the raw buffers used as cache keys."""
+    values = np.frombuffer(values_bytes, dtype=np.float64).copy()
+    index = pd.DatetimeIndex(
+        np.frombuffer(index_bytes, dtype=np.int64).view("datetime64[ns]"), freq=freq
+    )
+    return pd.Series(values, index=index)
 
-    When ``seasonal_periods`` is provided the model includes both
-    trend and seasonality; otherwise a simple additive trend is used.
-    Returns the forecast and fitted values as two series.
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _fit_exponential_smoothing(
+    values_bytes: bytes,
+    index_bytes: bytes,
+    freq: str,
+    forecast_horizon: int,
+    seasonal_periods: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit an exponential smoothing model and return forecast/fitted arrays.
+
+    The series is passed as raw bytes because fitted models are not
+    hashable and ``pd.Series`` is not a stable cache key; caching on the
+    underlying buffers means reruns with unchanged data and parameters
+    skip the fit entirely.
     """
+    series = _rebuild_series(values_bytes, index_bytes, freq)
+    if _AutoETS is not None and FORECAST_BACKEND in ("auto", "statsforecast"):
+        try:
+            model = _AutoETS(
+                season_length=seasonal_periods or 1,
+                model="AAA" if seasonal_periods else "AAN",
+            )
+            result = model.forecast(
+                y=series.to_numpy(), h=int(forecast_horizon), fitted=True
+            )
+            return np.asarray(result["mean"]), np.asarray(result["fitted"])
+        except Exception:
+            # Edge cases (e.g. very short or constant series) fall back
+            # to the paths below.
+            pass
+    if seasonal_periods is None and len(series) > 1:
+        try:
+            # In-tree compiled Holt recurrence: scipy optimizes the two
+            # smoothing parameters while each loss evaluation runs the
+            # jitted single-pass loop in forecast_utils.
+            fitted, forecast = fit_holt(series.to_numpy(), int(forecast_horizon))
+            return forecast, fitted
+        except Exception:
+            pass
     # Basic configuration: additive trend, optional seasonality
     try:
         model = ExponentialSmoothing(
@@ -239,35 +643,274 @@ def forecast_exponential_smoothing(
     except Exception as e:
         st.error(f"Exponential Smoothing failed: {e}")
         raise
-    forecast_index = pd.date_range(start=series.index[-1] + series.index.freq, periods=forecast_horizon, freq=series.index.freq)
     forecast = model.forecast(forecast_horizon)
-    forecast.index = forecast_index
-    fitted = model.fittedvalues
+    return forecast.to_numpy(), model.fittedvalues.to_numpy()
+
+
+def _ar1_i1_forecast(y: np.ndarray, h: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Closed-form forecast for ARIMA(1,1,0).
+
+    The default model order is a pure AR(1) on the differenced series,
+    which has the Yule-Walker solution
+    ``phi = <dy[1:], dy[:-1]> / <dy[:-1], dy[:-1]>`` and analytic
+    multi-step forecasts — no Kalman filter setup or optimizer needed.
+
+    Returns ``(forecast, fitted)`` arrays; raises on degenerate input so
+    the caller can fall back to a full fit.
+    """
+    y = np.asarray(y, dtype=np.float64)
+    dy = np.diff(y)
+    denom = float(dy[:-1] @ dy[:-1])
+    if denom == 0.0:
+        raise ValueError("Differenced series is constant; no AR(1) fit.")
+    phi = float(dy[1:] @ dy[:-1]) / denom
+    # One-step-ahead fitted values: previous level plus predicted change.
+    fitted = np.concatenate(([y[0]], y[:-1] + np.concatenate(([dy[0]], phi * dy[:-1]))))
+    forecast = y[-1] + np.cumsum(dy[-1] * phi ** np.arange(1, h + 1))
     return forecast, fitted
 
 
-def forecast_arima(
-    series: pd.Series, forecast_horizon: int, order: Tuple[int, int, int] = (1, 1, 0)
-) -> Tuple[pd.Series, pd.Series]:
-    """Produce a forecast using an ARIMA model.
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _fit_arima(
+    values_bytes: bytes,
+    index_bytes: bytes,
+    freq: str,
+    forecast_horizon: int,
+    order: Tuple[int, int, int],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Fit an ARIMA model and return forecast/fitted arrays (cached).
 
-    The default order (1,1,0) implements a simple differenced autoregressive
-    model; users can supply a different (p,d,q) tuple.  Returns the
-    forecast and fitted values.
+    When statsforecast is installed its compiled ARIMA is preferred: it
+    reparametrizes the AR/MA coefficients into partial autocorrelations
+    bounded in (-1, 1), so the optimizer searches an unconstrained box
+    instead of rejecting invalid coefficient vectors — the dominant cost
+    of the statsmodels fit at higher orders.
     """
+    series = _rebuild_series(values_bytes, index_bytes, freq)
+    if tuple(order) == (1, 1, 0) and len(series) >= 3:
+        try:
+            # The default order has a closed-form solution; skip the
+            # model machinery entirely.
+            return _ar1_i1_forecast(series.to_numpy(), int(forecast_horizon))
+        except Exception:
+            pass
+    if _CompiledARIMA is not None and FORECAST_BACKEND in ("auto", "statsforecast"):
+        try:
+            model = _CompiledARIMA(order=order, season_length=1)
+            result = model.forecast(
+                y=series.to_numpy(), h=int(forecast_horizon), fitted=True
+            )
+            return np.asarray(result["mean"]), np.asarray(result["fitted"])
+        except Exception:
+            pass
     try:
         model = ARIMA(series, order=order)
-        model_fit = model.fit()
+        # Bound the optimizer; the default iteration budget is far more
+        # than these small demand series need.
+        model_fit = model.fit(method_kwargs={"maxiter": 50})
     except Exception as e:
         st.error(f"ARIMA model failed: {e}")
         raise
     forecast_result = model_fit.get_forecast(steps=forecast_horizon)
+    return (
+        np.asarray(forecast_result.predicted_mean),
+        model_fit.fittedvalues.to_numpy(),
+    )
+
+
+def forecast_exponential_smoothing(
+    series: pd.Series, forecast_horizon: int, seasonal_periods: Optional[int] = None
+) -> Tuple[pd.Series, pd.Series]:
+    """Produce a forecast using Exponential Smoothing.
+
+    When ``seasonal_periods`` is provided the model includes both
+    trend and seasonality; otherwise a simple additive trend is used.
+    When statsforecast is installed its compiled ETS implementation is
+    used (see ``FORECAST_BACKEND``); otherwise the statsmodels
+    implementation is used.  Fits are cached so that Streamlit reruns
+    with the same series and parameters reuse the previous result.
+    Returns the forecast and fitted values as two series.
+    """
+    forecast_values, fitted_values = _fit_exponential_smoothing(
+        series.to_numpy(dtype=np.float64).tobytes(),
+        series.index.asi8.tobytes(),
+        series.index.freqstr,
+        int(forecast_horizon),
+        seasonal_periods,
+    )
+    forecast_index = pd.date_range(
+        start=series.index[-1] + series.index.freq, periods=forecast_horizon, freq=series.index.freq
+    )
+    forecast = pd.Series(forecast_values, index=forecast_index)
+    fitted = pd.Series(fitted_values, index=series.index)
+    return forecast, fitted
+
+
+def forecast_arima(
+    series: pd.Series, forecast_horizon: int, order: Tuple[int, int, int] = (1, 1, 0)
+) -> Tuple[pd.Series, pd.Series]:
+    """Produce a forecast using an ARIMA model.
+
+    The default order (1,1,0) implements a simple differenced autoregressive
+    model; users can supply a different (p,d,q) tuple.  Fits are cached
+    in the same way as :func:`forecast_exponential_smoothing`.  Returns
+    the forecast and fitted values.
+    """
+    forecast_values, fitted_values = _fit_arima(
+        series.to_numpy(dtype=np.float64).tobytes(),
+        series.index.asi8.tobytes(),
+        series.index.freqstr,
+        int(forecast_horizon),
+        tuple(int(o) for o in order),
+    )
     forecast_index = pd.date_range(start=series.index[-1] + series.index.freq, periods=forecast_horizon, freq=series.index.freq)
-    forecast = pd.Series(forecast_result.predicted_mean.values, index=forecast_index)
-    fitted = model_fit.fittedvalues
+    forecast = pd.Series(forecast_values, index=forecast_index)
+    fitted = pd.Series(fitted_values, index=series.index)
     return forecast, fitted
 
 
+# Z-scores for the whole 50-99% service-level slider range, computed
+# once at import.  The slider only produces integer percentages, so the
+# per-rerun scipy dispatch becomes an array lookup — and the full table
+# gives the safety-stock sensitivity chart for free.
+SL_GRID = np.arange(50, 100, dtype=np.int64)
+Z_TABLE = norm.ppf(SL_GRID / 100.0)
+
+
+@lru_cache(maxsize=64)
+def _z_from_service_level(service_level: float) -> float:
+    """Return the z-score for a service level fraction (memoized).
+
+    Users cycle through a handful of service levels via the slider, so
+    the scipy dispatch (argument validation, boxing) is paid at most
+    once per distinct level.
+    """
+    return float(norm.ppf(service_level))
+
+
+def _z_score(service_level: float) -> float:
+    """Z-score for a service level fraction.
+
+    Integer percentages in the slider range hit the precomputed table;
+    anything else goes through the memoized scipy call.
+    """
+    level_pct = int(round(service_level * 100.0))
+    if (
+        abs(service_level * 100.0 - level_pct) < 1e-9
+        and SL_GRID[0] <= level_pct <= SL_GRID[-1]
+    ):
+        return float(Z_TABLE[level_pct - SL_GRID[0]])
+    return _z_from_service_level(service_level)
+
+
+def inventory_curve(
+    series: pd.Series, forecast: pd.Series, service_level: float
+) -> pd.DataFrame:
+    """Compute inventory metrics for every candidate lead time at once.
+
+    Planners usually want the knee of the curve rather than a single
+    lead time.  One cumulative pass over the forecast yields demand
+    during lead time, safety stock and reorder point for every lead
+    time from 1 to ``len(forecast)`` — the same memory traffic as a
+    single evaluation.
+
+    Returns:
+        DataFrame indexed by lead time with columns
+        ``demand_during_lead``, ``safety_stock`` and ``reorder_point``.
+    """
+    f_arr = forecast.to_numpy(dtype=np.float64)
+    sigma = float(np.asarray(series.values, dtype=np.float64).std(ddof=1))
+    z_score = _z_score(service_level)
+    demand_during_lead = np.cumsum(f_arr)
+    lead_times = np.arange(1, f_arr.size + 1)
+    safety_stock = z_score * sigma * np.sqrt(lead_times)
+    return pd.DataFrame(
+        {
+            "demand_during_lead": demand_during_lead,
+            "safety_stock": safety_stock,
+            "reorder_point": demand_during_lead + safety_stock,
+        },
+        index=pd.Index(lead_times, name="lead_time"),
+    )
+
+
+def _forecast_chunk(
+    groups: list,
+    group_col: str,
+    date_col: str,
+    demand_col: str,
+    agg_func: str,
+    forecast_horizon: int,
+    seasonal_periods: Optional[int],
+) -> pd.DataFrame:
+    """Fit one chunk of groups sequentially and stack their forecasts."""
+    frames = []
+    for name, group in groups:
+        try:
+            series = prepare_time_series(group, date_col, demand_col, agg_func)
+            forecast, _ = forecast_exponential_smoothing(
+                series, forecast_horizon, seasonal_periods
+            )
+        except Exception:
+            # A group too short or degenerate to model should not sink
+            # the whole batch.
+            continue
+        frames.append(
+            pd.DataFrame(
+                {group_col: name, "date": forecast.index, "forecast": forecast.values}
+            )
+        )
+    if not frames:
+        return pd.DataFrame(columns=[group_col, "date", "forecast"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def forecast_many(
+    df: pd.DataFrame,
+    group_col: str,
+    date_col: str,
+    demand_col: str,
+    agg_func: str = "sum",
+    forecast_horizon: int = 30,
+    seasonal_periods: Optional[int] = None,
+    chunk_size: int = 100,
+    n_jobs: Optional[int] = None,
+) -> pd.DataFrame:
+    """Forecast every group (e.g. SKU) in a DataFrame in parallel.
+
+    Groups are split into chunks of ``chunk_size`` and each chunk is
+    fitted as one joblib task; chunking matters because per-task
+    dispatch overhead would otherwise dominate hundreds of small fits.
+    Workers return only the forecast frames, so memory stays flat.
+
+    Returns a long DataFrame with columns ``[group_col, 'date',
+    'forecast']``; groups that cannot be modelled are skipped.
+    """
+    groups = list(df.groupby(group_col, sort=False))
+    chunks = [groups[i : i + chunk_size] for i in range(0, len(groups), chunk_size)]
+    if len(chunks) <= 1:
+        # Not enough work to amortize worker start-up; run inline.
+        results = [
+            _forecast_chunk(
+                chunk, group_col, date_col, demand_col, agg_func,
+                forecast_horizon, seasonal_periods,
+            )
+            for chunk in chunks
+        ]
+    else:
+        results = Parallel(n_jobs=n_jobs or os.cpu_count(), backend="loky", batch_size=1)(
+            delayed(_forecast_chunk)(
+                chunk, group_col, date_col, demand_col, agg_func,
+                forecast_horizon, seasonal_periods,
+            )
+            for chunk in chunks
+        )
+    frames = [frame for frame in results if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=[group_col, "date", "forecast"])
+    return pd.concat(frames, ignore_index=True)
+
+
 def calculate_inventory_metrics(
     series: pd.Series,
     forecast: pd.Series,
@@ -291,14 +934,19 @@ def calculate_inventory_metrics(
         ``sigma`` (standard deviation), ``z_score``, ``safety_stock``,
         ``reorder_point`` and optionally ``eoq``.
     """
+    # Work on the underlying float64 buffers; the pandas reductions each
+    # route a boxed scalar through several dispatch layers, which adds
+    # up when this runs on every widget change.
+    s_arr = np.asarray(series.values, dtype=np.float64)
+    f_arr = np.asarray(forecast.values, dtype=np.float64)
     # Calculate average demand (per period)
-    avg_demand = series.mean()
+    avg_demand = float(s_arr.mean())
     # Demand during lead time (sum of forecast over lead_time periods)
-    demand_during_lead = forecast.iloc[:lead_time].sum()
+    demand_during_lead = float(f_arr[:lead_time].sum())
     # Standard deviation of historical demand
-    sigma = series.std()
+    sigma = float(s_arr.std(ddof=1))
     # Z-score from the service level
-    z_score = norm.ppf(service_level)
+    z_score = _z_score(service_level)
     # Safety stock formula: z * sigma * sqrt(lead_time)
     safety_stock = z_score * sigma * sqrt(lead_time)
     # Reorder point: expected demand during lead time + safety stock
@@ -323,18 +971,49 @@ def calculate_inventory_metrics(
 def render_forecast_chart(
     series: pd.Series, fitted: pd.Series, forecast: pd.Series, title: str
 ) -> None:
-    """Render an interactive chart of historical and forecasted demand."""
+    """Render an interactive chart of historical and forecasted demand.
+
+    Long histories are downsampled with largest-triangle-three-buckets
+    before plotting: beyond ~1500 points the extra detail is invisible
+    at screen resolution but inflates the JSON payload Plotly ships to
+    the browser on every rerun.  The historical traces use WebGL
+    (``Scattergl``), which stays responsive at high point counts; the
+    forecast trace is small and kept at full fidelity.
+    """
     df_plot = pd.DataFrame(
         {
             "Demand": series,
             "Fitted": fitted.reindex(series.index),
         }
     )
-    df_forecast = pd.DataFrame({"Forecast": forecast})
-    fig = px.line(df_plot, y=["Demand", "Fitted"], title=title)
-    # Add forecast line and shade for forecast horizon
-    for col in df_forecast.columns:
-        fig.add_scatter(x=df_forecast.index, y=df_forecast[col], mode="lines", name=col)
+    if len(df_plot) > 2000:
+        keep = lttb_indices(df_plot["Demand"].to_numpy(dtype=np.float64), 1500)
+        df_plot = df_plot.iloc[keep]
+    # Reuse the previous figure when the history length is unchanged:
+    # mutating trace data in place lets Plotly diff the update instead
+    # of re-rendering the whole chart from scratch on every rerun.
+    fig = st.session_state.get("_forecast_fig")
+    if fig is not None and st.session_state.get("_forecast_fig_len") == len(df_plot):
+        fig.update_traces(
+            selector=dict(name="Demand"), x=df_plot.index, y=df_plot["Demand"].to_numpy()
+        )
+        fig.update_traces(
+            selector=dict(name="Fitted"), x=df_plot.index, y=df_plot["Fitted"].to_numpy()
+        )
+        fig.update_traces(selector=dict(name="Forecast"), x=forecast.index, y=forecast.values)
+        # Drop the previous horizon shading before re-adding it below.
+        fig.layout.shapes = ()
+        fig.layout.annotations = ()
+        fig.update_layout(title=title)
+    else:
+        fig = go.Figure()
+        for col in ("Demand", "Fitted"):
+            fig.add_trace(
+                go.Scattergl(x=df_plot.index, y=df_plot[col], mode="lines", name=col)
+            )
+        # Add forecast line and shade for forecast horizon
+        fig.add_scatter(x=forecast.index, y=forecast.values, mode="lines", name="Forecast")
+        fig.update_layout(title=title)
     # Add shading for forecast horizon
     fig.add_vrect(
         x0=forecast.index[0], x1=forecast.index[-1],
@@ -342,7 +1021,88 @@ def render_forecast_chart(
         annotation_text="Forecast horizon", annotation_position="top left"
     )
     fig.update_layout(xaxis_title="Date", yaxis_title="Demand", hovermode="x unified")
-    st.plotly_chart(fig, use_container_width=True)
+    st.session_state["_forecast_fig"] = fig
+    st.session_state["_forecast_fig_len"] = len(df_plot)
+    st.plotly_chart(fig, key="forecast_fig", use_container_width=True)
+
+
+# Worker pool for file parsing and series preparation.  pandas' C
+# parser and aggregation code release the GIL, so running them here
+# keeps the Streamlit script thread free to render progress instead of
+# freezing the whole UI on large files.
+_POOL = cf.ThreadPoolExecutor(max_workers=2)
+
+
+def _run_with_status(label: str, func, *args, **kwargs):
+    """Run a blocking call on the worker pool behind a status box.
+
+    The current script-run context is attached to the worker thread so
+    Streamlit caching keeps working off the main thread.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+
+    def _call():
+        if ctx is not None:
+            add_script_run_ctx(threading.current_thread(), ctx)
+        return func(*args, **kwargs)
+
+    future = _POOL.submit(_call)
+    with st.status(label):
+        while not future.done():
+            time.sleep(0.05)
+    return future.result()
+
+
+def _session_put(key: str, obj) -> None:
+    """Store a DataFrame or Series in session state as Arrow IPC bytes.
+
+    Streamlit copies session-state values on every rerun; keeping large
+    pandas objects there pays a deep copy each time.  Serialized Arrow
+    buffers turn that into a cheap bytes copy, and deserialization is
+    near zero-copy back into NumPy for downstream compute.  Objects
+    Arrow cannot represent are stored as-is.
+    """
+    if obj is None:
+        st.session_state[key] = None
+        return
+    if isinstance(obj, pd.Series):
+        kind = "series"
+        freq = obj.index.freqstr if isinstance(obj.index, pd.DatetimeIndex) else None
+        frame = obj.rename("value").rename_axis("index").reset_index()
+    else:
+        kind = "frame"
+        freq = None
+        frame = obj
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=(kind == "frame"))
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        st.session_state[key] = (kind, freq, sink.getvalue())
+    except Exception:
+        st.session_state[key] = obj
+
+
+def _session_get(key: str):
+    """Rehydrate a value stored with :func:`_session_put`."""
+    value = st.session_state.get(key)
+    if not (
+        isinstance(value, tuple)
+        and len(value) == 3
+        and isinstance(value[2], (bytes, bytearray))
+    ):
+        return value
+    kind, freq, payload = value
+    frame = pa.ipc.open_stream(payload).read_all().to_pandas()
+    if kind == "series":
+        series = frame.set_index("index")["value"]
+        if freq:
+            try:
+                series.index.freq = freq
+            except Exception:
+                pass
+        return series
+    return frame
 
 
 def main() -> None:
@@ -366,11 +1126,14 @@ def main() -> None:
         ]
     )
 
-    # Cached data from previous interactions
-    data: Optional[pd.DataFrame] = st.session_state.get("data")
-    series: Optional[pd.Series] = st.session_state.get("series")
-    forecast: Optional[pd.Series] = st.session_state.get("forecast")
-    fitted: Optional[pd.Series] = st.session_state.get("fitted")
+    if st.sidebar.button("Clear model cache", help="Drop cached model fits and refit on the next run"):
+        st.cache_resource.clear()
+
+    # Cached data from previous interactions (stored as Arrow IPC bytes)
+    data: Optional[pd.DataFrame] = _session_get("data")
+    series: Optional[pd.Series] = _session_get("series")
+    forecast: Optional[pd.Series] = _session_get("forecast")
+    fitted: Optional[pd.Series] = _session_get("fitted")
 
     # Dashboard section
     if section == "Dashboard":
@@ -423,6 +1186,27 @@ def main() -> None:
             "You can either upload a CSV file or configure a database connection. "
             "For security, database credentials should be stored in environment variables."
         )
+        # Stored under a plain session key rather than a widget key:
+        # Streamlit drops a widget's key when the user navigates to a
+        # section where it isn't rendered, which would reset the choice
+        # before the Forecasting section could read it.
+        st.session_state["trim_outlier_dates"] = st.checkbox(
+            "Trim outlier dates",
+            value=bool(st.session_state.get("trim_outlier_dates", True)),
+            help=(
+                "Drop rows whose dates sit far outside the rest of the series "
+                "(e.g. a stray 1970-01-01) before filling missing dates."
+            ),
+        )
+        # Same persistence pattern as the trim toggle above.
+        st.session_state["downcast_float32"] = st.checkbox(
+            "Store demand as float32",
+            value=bool(st.session_state.get("downcast_float32", True)),
+            help=(
+                "Halves the memory the prepared series occupies. Untick if your "
+                "demand values need more than ~7 significant digits."
+            ),
+        )
         # File upload
         uploaded_data = load_data_from_upload()
         # Database load (optional)
@@ -437,7 +1221,7 @@ def main() -> None:
             st.info("Awaiting data upload or database configuration.")
 
         if data is not None:
-            st.session_state["data"] = data
+            _session_put("data", data)
             st.write("Preview of the first 5 rows:")
             st.dataframe(data.head())
             st.write(f"Dataset contains {len(data)} rows and {data.shape[1]} columns.")
@@ -468,18 +1252,35 @@ def main() -> None:
                 submitted = st.form_submit_button("Run Forecast")
             if submitted:
                 # Prepare the time series
-                series = prepare_time_series(data, date_col, demand_col, agg_func)
-                st.session_state["series"] = series
+                series = _run_with_status(
+                    "Preparing time series...",
+                    prepare_time_series,
+                    data,
+                    date_col,
+                    demand_col,
+                    agg_func,
+                    trim_outlier_dates=bool(st.session_state.get("trim_outlier_dates", True)),
+                    downcast_float32=bool(st.session_state.get("downcast_float32", True)),
+                )
+                _session_put("series", series)
                 try:
                     if model_type == "Exponential Smoothing":
                         s_periods = int(seasonal_periods) if seasonal_periods > 0 else None
                         forecast, fitted = forecast_exponential_smoothing(series, int(forecast_horizon), s_periods)
                     else:
-                        order = (int(arima_p), int(arima_d), int(arima_q))
-                        forecast, fitted = forecast_arima(series, int(forecast_horizon), order)
+                        p, d, q = int(arima_p), int(arima_d), int(arima_q)
+                        if p + q > 5:
+                            # Fit time blows up combinatorially with the
+                            # total AR+MA order.
+                            q = max(0, 5 - p) if p <= 5 else 0
+                            p = min(p, 5)
+                            st.warning(
+                                f"High ARIMA orders fit very slowly; using order ({p},{d},{q}) instead."
+                            )
+                        forecast, fitted = forecast_arima(series, int(forecast_horizon), (p, d, q))
                     # Save results in session state
-                    st.session_state["forecast"] = forecast
-                    st.session_state["fitted"] = fitted
+                    _session_put("forecast", forecast)
+                    _session_put("fitted", fitted)
                     # Plot the results
                     st.success("Forecast completed.")
                     render_forecast_chart(series, fitted, forecast, title="Historical and Forecasted Demand")
@@ -489,6 +1290,33 @@ def main() -> None:
                 except Exception as e:
                     st.error(f"An error occurred during forecasting: {e}")
 
+            with st.expander("Batch forecast by SKU", expanded=False):
+                st.markdown(
+                    "Fit one exponential smoothing model per group (e.g. per SKU) "
+                    "in parallel and download the combined forecast."
+                )
+                with st.form("batch_forecast_form"):
+                    batch_group_col = st.selectbox("Group column (e.g. SKU)", options=data.columns)
+                    batch_date_col = st.selectbox("Date column", options=data.columns, key="batch_date_col")
+                    batch_demand_col = st.selectbox("Demand column", options=data.columns, key="batch_demand_col")
+                    batch_agg = st.selectbox("Aggregation", options=["sum", "mean"], index=0, key="batch_agg")
+                    batch_horizon = st.number_input(
+                        "Forecast horizon (number of periods)", min_value=1, max_value=365, value=30,
+                        key="batch_horizon",
+                    )
+                    submitted_batch = st.form_submit_button("Run Batch Forecast")
+                if submitted_batch:
+                    with st.spinner("Fitting one model per group..."):
+                        batch_result = forecast_many(
+                            data, batch_group_col, batch_date_col, batch_demand_col,
+                            batch_agg, int(batch_horizon),
+                        )
+                    if batch_result.empty:
+                        st.warning("No group produced a usable forecast.")
+                    else:
+                        st.success(f"Forecasted {batch_result[batch_group_col].nunique()} groups.")
+                        st.dataframe(batch_result)
+
     # Inventory optimisation section
     elif section == "Inventory Optimisation":
         st.header("Inventory Optimisation")
@@ -551,6 +1379,34 @@ def main() -> None:
                         continue
                     results.append({"Metric": metric_labels.get(key, key), "Value": round(float(value), 2)})
                 st.table(pd.DataFrame(results))
+                # The precomputed z-score table makes the whole
+                # sensitivity sweep free: one vectorized expression
+                # instead of one scipy call per service level.
+                st.subheader("Safety Stock Sensitivity")
+                sensitivity = pd.DataFrame(
+                    {
+                        "Service level (%)": SL_GRID,
+                        "Safety stock": Z_TABLE * metrics["sigma"] * sqrt(int(lead_time)),
+                    }
+                )
+                sens_fig = px.line(
+                    sensitivity,
+                    x="Service level (%)",
+                    y="Safety stock",
+                    title="Safety stock vs desired service level",
+                )
+                st.plotly_chart(sens_fig, use_container_width=True)
+                # Whole lead-time sweep from one cumulative pass over
+                # the forecast — helps pick the knee of the curve.
+                st.subheader("Reorder Point by Lead Time")
+                curve = inventory_curve(series, forecast, service_level)
+                curve_fig = px.line(
+                    curve,
+                    y=["demand_during_lead", "safety_stock", "reorder_point"],
+                    title="Inventory metrics across candidate lead times",
+                    labels={"value": "Units", "lead_time": "Lead time (periods)"},
+                )
+                st.plotly_chart(curve_fig, use_container_width=True)
                 st.info(
                     "The reorder point is the inventory level at which a new order should be placed. "
                     "Safety stock provides a buffer against demand variability and supply delays. "
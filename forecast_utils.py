@@ -0,0 +1,143 @@
+"""
+Compiled numeric kernels for the Demand Planning app.
+
+This module holds small, tight loops that dominate forecasting cost when
+the compiled statsforecast backend is unavailable.  numba is optional:
+when it is not installed the kernels run as plain Python over NumPy
+arrays and produce identical (just slower) results, so the app keeps
+working from the base requirements.
+"""
+
+import numpy as np
+from scipy.optimize import minimize
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is missing."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+
+@njit(cache=True)
+def holt_add(y: np.ndarray, alpha: float, beta: float, h: int):
+    """Run the additive Holt (level + trend) recurrence in one pass.
+
+    Args:
+        y: Observed values as a contiguous float64 array.
+        alpha: Level smoothing parameter in (0, 1).
+        beta: Trend smoothing parameter in (0, 1).
+        h: Number of periods to forecast.
+
+    Returns:
+        Tuple of ``(fitted, forecast)`` where ``fitted`` holds the
+        one-step-ahead predictions for each observation and ``forecast``
+        extrapolates ``h`` periods beyond the last observation.
+    """
+    n = y.shape[0]
+    fitted = np.empty(n)
+    level = y[0]
+    trend = y[1] - y[0] if n > 1 else 0.0
+    fitted[0] = y[0]
+    for i in range(1, n):
+        fitted[i] = level + trend
+        new_level = alpha * y[i] + (1.0 - alpha) * (level + trend)
+        trend = beta * (new_level - level) + (1.0 - beta) * trend
+        level = new_level
+    forecast = np.empty(h)
+    for j in range(h):
+        forecast[j] = level + (j + 1.0) * trend
+    return fitted, forecast
+
+
+def _holt_sse(params: np.ndarray, y: np.ndarray) -> float:
+    """Sum of squared one-step-ahead errors for the Holt recurrence."""
+    fitted, _ = holt_add(y, params[0], params[1], 0)
+    resid = y - fitted
+    return float(resid @ resid)
+
+
+def fit_holt(y: np.ndarray, h: int):
+    """Fit additive Holt smoothing by minimizing the one-step SSE.
+
+    The optimizer runs over the two smoothing parameters only; each loss
+    evaluation is a single pass of the compiled recurrence, so the whole
+    fit avoids Python-level per-observation work.
+
+    Returns the same ``(fitted, forecast)`` pair as :func:`holt_add`.
+    """
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    result = minimize(
+        _holt_sse,
+        x0=np.array([0.3, 0.1]),
+        args=(y,),
+        bounds=[(1e-4, 1.0 - 1e-4)] * 2,
+        method="L-BFGS-B",
+    )
+    alpha, beta = result.x
+    return holt_add(y, float(alpha), float(beta), int(h))
+
+
+@njit(cache=True)
+def lttb_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """Largest-triangle-three-buckets downsampling.
+
+    Returns the indices of ``n_out`` points chosen to preserve the
+    visual shape of ``y`` when plotted: the first and last points are
+    kept, and each interior bucket keeps the point forming the largest
+    triangle with the previously selected point and the average of the
+    next bucket.  If ``y`` is already small enough, all indices are
+    returned unchanged.
+    """
+    n = y.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    out[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    selected = 0
+    for i in range(n_out - 2):
+        lo = int(i * every) + 1
+        hi = min(int((i + 1) * every) + 1, n - 1)
+        next_hi = min(int((i + 2) * every) + 1, n)
+        # Average of the next bucket (falls back to the last point).
+        avg_x = 0.0
+        avg_y = 0.0
+        count = next_hi - hi
+        if count > 0:
+            for j in range(hi, next_hi):
+                avg_x += j
+                avg_y += y[j]
+            avg_x /= count
+            avg_y /= count
+        else:
+            avg_x = n - 1.0
+            avg_y = y[n - 1]
+        base_x = float(selected)
+        base_y = y[selected]
+        best_area = -1.0
+        best_idx = lo
+        for j in range(lo, hi):
+            area = abs(
+                (base_x - avg_x) * (y[j] - base_y) - (base_x - j) * (avg_y - base_y)
+            )
+            if area > best_area:
+                best_area = area
+                best_idx = j
+        out[i + 1] = best_idx
+        selected = best_idx
+    return out
+
+
+# Warm the JIT once at import with tiny inputs so the first user-facing
+# forecast/chart does not pay the compile latency.
+holt_add(np.arange(4, dtype=np.float64), 0.5, 0.1, 1)
+lttb_indices(np.arange(8, dtype=np.float64), 4)
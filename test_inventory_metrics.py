@@ -15,7 +15,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from demand_planning_app import calculate_inventory_metrics
+from demand_planning_app import calculate_inventory_metrics, inventory_curve
 
 
 def test_basic_inventory_metrics():
@@ -56,4 +56,25 @@ def test_eoq_calculation():
     # EOQ should exist in the returned metrics
     assert "eoq" in metrics
     # Basic sanity check: EOQ should be positive and larger than zero
-    assert metrics["eoq"] > 0
\ No newline at end of file
+    assert metrics["eoq"] > 0
+
+
+def test_inventory_curve_matches_single_lead_time():
+    """The vectorized curve should agree with the scalar metrics."""
+    dates = pd.date_range(start="2025-01-01", periods=30, freq="D")
+    demand_values = np.linspace(20, 40, len(dates))
+    series = pd.Series(demand_values, index=dates)
+    forecast = pd.Series(
+        np.linspace(40, 45, 7),
+        index=pd.date_range(start=dates[-1] + pd.Timedelta(days=1), periods=7, freq="D"),
+    )
+    service_level = 0.95
+    curve = inventory_curve(series, forecast, service_level)
+    # One row per forecast period, indexed by lead time starting at 1
+    assert list(curve.index) == list(range(1, len(forecast) + 1))
+    lead_time = 3
+    metrics = calculate_inventory_metrics(series, forecast, lead_time, service_level)
+    row = curve.loc[lead_time]
+    assert row["demand_during_lead"] == pytest.approx(metrics["demand_during_lead"])
+    assert row["safety_stock"] == pytest.approx(metrics["safety_stock"])
+    assert row["reorder_point"] == pytest.approx(metrics["reorder_point"])
@@ -6,25 +6,92 @@ correctly, handles aggregation and missing values, infers a reasonable
 frequency, and returns a Pandas Series with a datetime index.
 """
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from demand_planning_app import prepare_time_series
 
+# Timestamps used in assertions, parsed once at import instead of once
+# per test invocation.
+_D1 = pd.Timestamp("2025-01-01")
+_D3 = pd.Timestamp("2025-01-03")
+_D4 = pd.Timestamp("2025-01-04")
 
-def test_prepare_time_series_defaults():
-    """Prepare a simple series and verify its properties."""
-    data = pd.DataFrame(
+
+@pytest.fixture(scope="module")
+def default_data():
+    """Input DataFrame shared by the default-preparation tests.
+
+    Built once per module: each parametrized case below asserts against
+    the same prepared series, so rebuilding the input (dtype inference,
+    allocations) per case would be pure overhead.
+    """
+    return pd.DataFrame(
         {
-            "date": ["2025-01-01", "2025-01-02", "2025-01-04", "2025-01-04"],
-            "demand": [10, 12, 8, 7],
+            # Typed arrays skip pandas' dtype inference and per-element
+            # boxing during construction, and the datetime column lets
+            # the helper skip its internal string re-parse.
+            "date": np.array(
+                ["2025-01-01", "2025-01-02", "2025-01-04", "2025-01-04"],
+                dtype="datetime64[D]",
+            ),
+            "demand": np.array([10, 12, 8, 7], dtype=np.int64),
         }
     )
-    series = prepare_time_series(data, "date", "demand", agg_func="sum")
-    # Index should be datetime
-    assert isinstance(series.index, pd.DatetimeIndex)
+
+
+@pytest.fixture(scope="module")
+def default_series(default_data):
+    """Series prepared once with default arguments."""
+    return prepare_time_series(default_data, "date", "demand", agg_func="sum")
+
+
+def test_prepare_time_series_index(default_series):
+    """The prepared series has a datetime index with daily frequency."""
+    assert isinstance(default_series.index, pd.DatetimeIndex)
     # The frequency should be daily (1D) inferred and missing dates filled
-    assert series.index.freq == pd.offsets.Day()
-    # Aggregation: value for 2025-01-04 should combine two rows (8 + 7)
-    assert series.loc[pd.Timestamp("2025-01-04")] == 15
-    # Missing date 2025-01-03 should be filled by forward fill (value 12)
-    assert series.loc[pd.Timestamp("2025-01-03")] == 12
\ No newline at end of file
+    assert default_series.index.freq == pd.offsets.Day()
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    [
+        # First observation passes through unchanged.
+        (_D1, 10),
+        # Missing date 2025-01-03 should be filled by forward fill (value 12)
+        (_D3, 12),
+        # Aggregation: value for 2025-01-04 should combine two rows (8 + 7)
+        (_D4, 15),
+    ],
+)
+def test_prepare_time_series_values(default_series, date, expected):
+    """Each date maps to its aggregated (or forward-filled) value."""
+    assert default_series.loc[date] == expected
+
+
+def _total(values, index=None):
+    """Callable aggregation usable by both the cython and numba engines."""
+    return values.sum()
+
+
+def test_prepare_time_series_numba_engine_matches_cython():
+    """A callable aggregation gives identical results under the numba engine."""
+    pytest.importorskip("numba")
+
+    data = pd.DataFrame(
+        {
+            "date": ["2025-01-01", "2025-01-02", "2025-01-02", "2025-01-03"],
+            "demand": [10.0, 12.0, 8.0, 7.0],
+        }
+    )
+    baseline = prepare_time_series(data, "date", "demand", agg_func=_total)
+    jitted = prepare_time_series(
+        data,
+        "date",
+        "demand",
+        agg_func=_total,
+        engine="numba",
+        engine_kwargs={"nopython": True, "nogil": True},
+    )
+    pd.testing.assert_series_equal(baseline, jitted)